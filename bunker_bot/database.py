@@ -2,8 +2,9 @@ import json
 import os
 import asyncio
 import shutil
-from typing import Dict, Any
-from .settings import logger, DB_FILE, GAME_DB_FILE
+import orjson
+from typing import Dict, List, Optional, Tuple, Any
+from .settings import logger, DB_FILE, GAME_DB_FILE, SAVE_DEBOUNCE
 
 _user_db_lock = asyncio.Lock()
 _game_db_lock = asyncio.Lock()
@@ -11,10 +12,13 @@ _game_db_lock = asyncio.Lock()
 # In-memory cache for users
 global_db: Dict[str, Any] = {"users": {}, "servers": {}}
 
+# Resolved server languages: {guild_id: lang}. Cleared on DB reload.
+_lang_cache: Dict[int, str] = {}
+
 # --- HELPER ---
 def _load_json_file(filepath: str) -> Dict[str, Any]:
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(filepath, "rb") as f:
+        return orjson.loads(f.read())
 
 # --- USER STATS OPERATIONS ---
 
@@ -53,13 +57,17 @@ async def load_user_db() -> Dict[str, Any]:
                 global_db = {"users": data, "servers": {}}
             else:
                 global_db = data
+            _lang_cache.clear()
             return global_db
     except Exception as e:
         logger.error(f"User DB Load Error: {e}")
         return {"users": {}, "servers": {}}
 
-async def save_user_db_data(data: Dict[str, Any]) -> None:
+async def save_user_db_data(data: Dict[str, Any]) -> bool:
+    """Writes the user DB. Returns False if the write failed."""
     try:
+        # Serialize on the loop: handlers mutate global_db while the thread writes
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
         async with _user_db_lock:
             def write():
                 # Create backup before overwrite
@@ -69,11 +77,45 @@ async def save_user_db_data(data: Dict[str, Any]) -> None:
                     except Exception as e:
                         logger.warning(f"Failed to create User DB backup: {e}")
 
-                with open(DB_FILE, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+                with open(DB_FILE, "wb") as f:
+                    f.write(payload)
             await asyncio.to_thread(write)
+        return True
     except Exception as e:
         logger.error(f"User DB Write Error: {e}")
+        return False
+
+# Stat/name/language mutations only touch global_db in memory and mark it dirty;
+# a single background task writes the file, so handlers never wait on disk.
+# The Event is created on the running loop; on Python 3.9 an import-time one binds elsewhere.
+_user_db_dirty: Optional[asyncio.Event] = None
+_user_db_writer: Optional[asyncio.Task] = None
+
+def request_user_db_save() -> None:
+    """Marks the user DB dirty. Never blocks; starts the writer on first use."""
+    global _user_db_dirty, _user_db_writer
+    if _user_db_dirty is None:
+        _user_db_dirty = asyncio.Event()
+    _user_db_dirty.set()
+    if _user_db_writer is None or _user_db_writer.done():
+        _user_db_writer = asyncio.get_running_loop().create_task(_user_db_writer_loop())
+
+async def _user_db_writer_loop() -> None:
+    while True:
+        await _user_db_dirty.wait()
+        # Let a burst of updates (e.g. a whole vote round) land in one write
+        await asyncio.sleep(SAVE_DEBOUNCE)
+        _user_db_dirty.clear()
+        if not await save_user_db_data(global_db):
+            # Keep the changes pending so the next pass (or shutdown) retries
+            _user_db_dirty.set()
+
+async def flush_user_db() -> None:
+    """Writes pending user DB changes now (used on shutdown)."""
+    if _user_db_dirty is not None and _user_db_dirty.is_set():
+        _user_db_dirty.clear()
+        if not await save_user_db_data(global_db):
+            _user_db_dirty.set()
 
 # --- ACTIVE GAMES OPERATIONS (RAW JSON) ---
 
@@ -132,8 +174,11 @@ async def load_raw_active_games() -> Dict[str, Any]:
 # --- ACCESSORS ---
 
 def get_server_lang(guild_id: int) -> str:
-    gid = str(guild_id)
-    return global_db["servers"].get(gid, {}).get("lang", "uk")
+    lang = _lang_cache.get(guild_id)
+    if lang is None:
+        gid = str(guild_id)
+        lang = _lang_cache[guild_id] = global_db["servers"].get(gid, {}).get("lang", "uk")
+    return lang
 
 def get_server_stats(guild_id: int) -> int:
     gid = str(guild_id)
@@ -155,9 +200,10 @@ async def set_server_lang(guild_id: int, lang: str) -> None:
     gid = str(guild_id)
     if gid not in global_db["servers"]: global_db["servers"][gid] = {}
     global_db["servers"][gid]["lang"] = lang
-    await save_user_db_data(global_db)
+    _lang_cache[guild_id] = lang
+    request_user_db_save()
 
-async def update_user_stats(user_id: int, key: str, val: Any = 1) -> None:
+def _apply_user_stat(user_id: int, key: str, val: Any) -> None:
     u = get_user_data(user_id)
     if key == "game_start" and isinstance(val, dict):
         u["games"] += 1
@@ -166,7 +212,17 @@ async def update_user_stats(user_id: int, key: str, val: Any = 1) -> None:
         u["sex_stats"][sex_key] += 1
     elif key in u:
         u[key] += val
-    await save_user_db_data(global_db)
+
+async def update_user_stats(user_id: int, key: str, val: Any = 1) -> None:
+    _apply_user_stat(user_id, key, val)
+    request_user_db_save()
+
+async def update_user_stats_bulk(updates: List[Tuple[int, str, Any]]) -> None:
+    """Applies many (user_id, key, val) updates and queues a single DB write."""
+    if not updates: return
+    for user_id, key, val in updates:
+        _apply_user_stat(user_id, key, val)
+    request_user_db_save()
 
 async def reset_user_stats(user_id: int) -> None:
     u = get_user_data(user_id)
@@ -175,16 +231,16 @@ async def reset_user_stats(user_id: int) -> None:
     u["deaths"] = 0
     u["total_age"] = 0
     u["sex_stats"] = {"m": 0, "f": 0}
-    await save_user_db_data(global_db)
+    request_user_db_save()
 
 async def update_server_games(guild_id: int) -> None:
     gid = str(guild_id)
     if gid not in global_db["servers"]: global_db["servers"][gid] = {}
     srv = global_db["servers"][gid]
     srv["games_played"] = srv.get("games_played", 0) + 1
-    await save_user_db_data(global_db)
+    request_user_db_save()
 
 async def set_custom_name(user_id: int, name: str) -> None:
     u = get_user_data(user_id)
     u["name"] = name
-    await save_user_db_data(global_db)
\ No newline at end of file
+    request_user_db_save()
\ No newline at end of file
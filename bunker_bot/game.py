@@ -1,16 +1,16 @@
 import random
 import asyncio
+from collections import Counter
 import discord
 from discord.ext import commands
-from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple, Any
-import logging
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple, Any
 import math
-import os
+import weakref
 
-from .settings import logger, GAME_DB_FILE, EmbedColors
+from .settings import logger, FETCH_TIMEOUT, SAVE_DEBOUNCE, BOARD_DEBOUNCE, EmbedColors
 from .i18n import T
-from .database import get_user_data, update_user_stats, update_server_games, save_raw_active_games
+from .database import get_user_data, update_server_games, save_raw_active_games
 
 # Global games registry: {guild_id: GameState}
 # Protected by _games_lock for thread safety
@@ -28,33 +28,73 @@ async def set_game(guild_id: int, game: 'GameState') -> None:
     async with _games_lock:
         games[guild_id] = game
 
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+_BG_TASKS: Set[asyncio.Task] = set()
+
+# Per-guild locks that serialize UI actions on one game while other guilds run in parallel.
+# Weak values: a lock disappears once no handler holds or waits on it.
+_guild_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+def guild_lock(guild_id: int) -> asyncio.Lock:
+    lock = _guild_locks.get(guild_id)
+    if lock is None:
+        lock = _guild_locks[guild_id] = asyncio.Lock()
+    return lock
+
+def spawn(coro) -> asyncio.Task:
+    """Starts a background task and keeps it referenced until it finishes."""
+    task = asyncio.create_task(coro)
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+    return task
+
 class SaveManager:
     """
-    Handles game state persistence with debouncing to prevent
-    disk I/O thrashing and race conditions.
+    Handles game state persistence through a single background writer
+    to prevent disk I/O thrashing and race conditions.
     """
-    _save_scheduled = False
+    # Created on the running loop (see _event); on Python 3.9 an import-time
+    # Event would bind to a different loop than the one bot.run() starts
+    _dirty: Optional[asyncio.Event] = None
+    _writer: Optional[asyncio.Task] = None
     _lock = asyncio.Lock()
 
     @classmethod
-    async def request(cls) -> None:
-        """Schedules a save operation in the near future (Debounce).
+    def _event(cls) -> asyncio.Event:
+        if cls._dirty is None:
+            cls._dirty = asyncio.Event()
+        return cls._dirty
+
+    @classmethod
+    def start(cls) -> None:
+        """Starts the writer task if it is not already running."""
+        if cls._writer is None or cls._writer.done():
+            cls._writer = asyncio.create_task(cls._writer_loop())
+
+    @classmethod
+    def request(cls) -> None:
+        """Marks game state dirty. Never blocks the caller."""
+        cls._event().set()
+
+    @classmethod
+    async def _writer_loop(cls) -> None:
+        """Waits for save requests and writes once per burst.
         
-        This method uses a lock to ensure thread safety when checking and setting
-        the schedule flag, preventing multiple concurrent saves.
+        Every write serializes all games, so requests arriving within
+        SAVE_DEBOUNCE of the first one share a single write; requests made
+        while a write is in progress trigger one more.
         """
-        async with cls._lock:
-            if cls._save_scheduled:
-                return
-            cls._save_scheduled = True
-        
-        # Debounce delay outside the lock to allow other tasks to run
-        await asyncio.sleep(2.0)
-        
-        await cls.force()
-        
-        async with cls._lock:
-            cls._save_scheduled = False
+        dirty = cls._event()
+        while True:
+            await dirty.wait()
+            # Short window so closely spaced mutations share one write
+            await asyncio.sleep(SAVE_DEBOUNCE)
+            dirty.clear()
+            
+            try:
+                await cls.force()
+            except Exception as e:
+                logger.error(f"Save writer error: {e}")
 
     @classmethod
     async def force(cls) -> None:
@@ -70,6 +110,17 @@ class SaveManager:
 
             await save_raw_active_games(data)
 
+# Card keys in display order (fixed by the game schema, not the language file)
+CARD_KEYS = ("sex", "age", "height", "body", "job", "health", "hobby", "phobia", "inventory", "extra")
+
+# Player.opened_mask bit for each card, and the mask with every card open
+CARD_BITS = {k: 1 << i for i, k in enumerate(CARD_KEYS)}
+ALL_CARDS_MASK = (1 << len(CARD_KEYS)) - 1
+
+# Status icons indexed by bool: ICON[False], ICON[True]
+_ALIVE_ICON = ("💀", "🟢")
+_OPEN_ICON = ("🔒", "✅")
+
 class GamePhase(Enum):
     """Enum representing the current phase of the game."""
     WAITING = 1
@@ -79,14 +130,19 @@ class GamePhase(Enum):
 
 class Player:
     """Represents a single player in the game."""
+    __slots__ = ("user_id", "lang", "titles", "name", "alive", "cards", "opened_mask")
+
     def __init__(self, user_id: int, discord_name: str, lang: str):
         self.user_id = user_id
         self.lang = lang
+        # Card titles for this player's language, resolved once instead of on every menu/profile build
+        self.titles: Dict[str, str] = T("card_titles", lang)
         u = get_user_data(user_id)
         self.name = u["name"] if u["name"] else discord_name
         self.alive = True
         self.cards: Dict[str, str] = {}
-        self.opened: Dict[str, bool] = {}
+        # Bit i set = CARD_KEYS[i] revealed
+        self.opened_mask = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -95,7 +151,7 @@ class Player:
             "lang": self.lang,
             "alive": self.alive,
             "cards": self.cards,
-            "opened": self.opened
+            "opened_mask": self.opened_mask
         }
 
     @classmethod
@@ -103,9 +159,26 @@ class Player:
         p = cls(data["user_id"], data["name"], data["lang"])
         p.alive = data["alive"]
         p.cards = data["cards"]
-        p.opened = data["opened"]
+        if "opened_mask" in data:
+            p.opened_mask = data["opened_mask"]
+        else:
+            # Saves from before the bitmask stored a {card: bool} dict
+            p.opened_mask = sum(bit for k, bit in CARD_BITS.items() if data.get("opened", {}).get(k))
         return p
 
+    def is_open(self, key: str) -> bool:
+        return bool(self.opened_mask & CARD_BITS.get(key, 0))
+
+    def open_card(self, key: str) -> bool:
+        """Reveals one card. Returns False if it was already open (or is unknown)."""
+        bit = CARD_BITS.get(key, 0)
+        if not bit or self.opened_mask & bit: return False
+        self.opened_mask |= bit
+        return True
+
+    def open_all(self) -> None:
+        self.opened_mask = ALL_CARDS_MASK
+
     def generate(self) -> None:
         D = T("data", self.lang)
         H_Dict = T("health", self.lang)
@@ -126,18 +199,16 @@ class Player:
             "inventory": random.choice(D["inventory"]),
             "extra": random.choice(D["extra"]),
         }
-        self.opened = {k: False for k in self.cards}
+        self.opened_mask = 0
 
     def get_profile_text(self, show_hidden: bool = False) -> str:
-        lines = []
-        titles = T("card_titles", self.lang)
-        for key, title in titles.items():
-            value = self.cards.get(key, "???")
-            is_open = self.opened.get(key, False)
-            status = "✅" if is_open or show_hidden else "🔒"
-            val_text = value if is_open or show_hidden else "???"
-            lines.append(f"{status} **{title}**: {val_text}")
-        return "\n".join(lines)
+        titles = self.titles
+        cards, mask = self.cards, (ALL_CARDS_MASK if show_hidden else self.opened_mask)
+        return "\n".join(
+            f"{_OPEN_ICON[visible]} **{titles.get(key, key)}**: {cards.get(key, '???') if visible else '???'}"
+            for key, bit in CARD_BITS.items()
+            for visible in (bool(mask & bit),)
+        )
 
 class GameState:
     """Manages the state of a single game session."""
@@ -155,12 +226,23 @@ class GameState:
         
         self.board_msg_id: Optional[int] = None
         self.dash_msg_id: Optional[int] = None
+        # Message of the vote currently open; a VoteView timing out for any other message is stale
+        self.vote_msg_id: Optional[int] = None
+        # Dashboard posted with per-guild custom_ids (before dashboards were shared per language)
+        self.legacy_dash = False
         self.channel_id: Optional[int] = None
 
         self.board_message: Optional[discord.Message] = None
+        # Embed payload last written to the board; identical renders skip the edit
+        self._board_payload: Optional[Dict[str, Any]] = None
+        self._board_pending = False
         self.dashboard_view: Optional[discord.ui.View] = None
         self.join_view: Optional[discord.ui.View] = None 
 
+        # Lookup indexes over self.players
+        self._by_id: Dict[int, Player] = {}
+        self._alive_ids: Set[int] = set()
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "max_players": self.max_players,
@@ -174,6 +256,7 @@ class GameState:
             "double_elim_next": self.double_elim_next,
             "board_msg_id": self.board_msg_id,
             "dash_msg_id": self.dash_msg_id,
+            "legacy_dash": self.legacy_dash,
             "channel_id": self.channel_id,
             "players": [p.to_dict() for p in self.players]
         }
@@ -188,10 +271,17 @@ class GameState:
         g.double_elim_next = data["double_elim_next"]
         g.board_msg_id = data.get("board_msg_id")
         g.dash_msg_id = data.get("dash_msg_id")
+        g.legacy_dash = data.get("legacy_dash", g.dash_msg_id is not None)
         g.channel_id = data.get("channel_id")
         g.players = [Player.from_dict(p_data) for p_data in data["players"]]
+        g._reindex()
         return g
 
+    def _reindex(self) -> None:
+        """Rebuilds the player lookup indexes from self.players."""
+        self._by_id = {p.user_id: p for p in self.players}
+        self._alive_ids = {p.user_id for p in self.players if p.alive}
+
     def validate(self) -> bool:
         """Validates the consistency of the loaded game state."""
         try:
@@ -218,24 +308,35 @@ class GameState:
 
     def add_player(self, user_id: int, name: str) -> bool:
         if len(self.players) >= self.max_players: return False
-        if any(p.user_id == user_id for p in self.players): return False
+        if user_id in self._by_id: return False
         
         # Security: Sanitize name to prevent exploits
         safe_name = discord.utils.escape_mentions(name)
         safe_name = discord.utils.escape_markdown(safe_name)
         safe_name = safe_name[:20] # Enforce length limit
         
-        self.players.append(Player(user_id, safe_name, self.lang))
+        player = Player(user_id, safe_name, self.lang)
+        self.players.append(player)
+        self._by_id[user_id] = player
+        self._alive_ids.add(user_id)
         # Request save instead of saving immediately
-        asyncio.create_task(SaveManager.request())
+        SaveManager.request()
         return True
 
     def get_player(self, user_id: int) -> Optional[Player]:
-        return next((p for p in self.players if p.user_id == user_id), None)
+        return self._by_id.get(user_id)
 
     def alive_players(self) -> List[Player]:
         return [p for p in self.players if p.alive]
 
+    def alive_count(self) -> int:
+        return len(self._alive_ids)
+
+    def eliminate(self, player: Player) -> None:
+        """Marks a player as dead and keeps the alive index in sync."""
+        player.alive = False
+        self._alive_ids.discard(player.user_id)
+
     async def start_game(self) -> None:
         logger.info(f"Starting game in guild {self.guild_id}")
         count = len(self.players)
@@ -250,7 +351,7 @@ class GameState:
         
         self.lore_text = f"{random.choice(D['catastrophes'])}\n\n**Loc**: {random.choice(D['bunker_types'])}\n**Cond**: {random.choice(D['supplies'])}\n⏳ {random.choice(D['durations'])}"
         self.phase = GamePhase.REVEAL
-        asyncio.create_task(SaveManager.request())
+        SaveManager.request()
 
     async def end_game(self, bot: commands.Bot) -> None:
         logger.info(f"Ending game in guild {self.guild_id}")
@@ -264,7 +365,7 @@ class GameState:
                 ch = bot.get_channel(self.channel_id)
                 if not ch: 
                     try: ch = await bot.fetch_channel(self.channel_id)
-                    except: pass
+                    except discord.HTTPException: pass
                 
                 if ch:
                     if self.dash_msg_id:
@@ -290,6 +391,8 @@ class GameState:
                 logger.warning(f"Guild {self.guild_id}: Channel cleanup error: {e}")
         
         self.players.clear()
+        self._by_id.clear()
+        self._alive_ids.clear()
         self.votes.clear()
         self.board_message = None
         self.dashboard_view = None
@@ -300,7 +403,7 @@ class GameState:
             if self.guild_id in games:
                 del games[self.guild_id]
         
-        asyncio.create_task(SaveManager.force())
+        spawn(SaveManager.force())
 
     async def register_vote(self, user_id: int, targets: List[int]) -> bool:
         """Registers a vote with validation."""
@@ -316,22 +419,20 @@ class GameState:
                 raise ValueError("Cannot vote for dead players.")
 
         self.votes[user_id] = [int(t) for t in targets]
-        asyncio.create_task(SaveManager.request())
+        SaveManager.request()
         return True
 
     def resolve_votes(self) -> Tuple[List[Player], str, bool]:
-        alive_ids = {p.user_id for p in self.alive_players()}
-        # Filter votes from dead people
-        active_votes = {k: v for k, v in self.votes.items() if k in alive_ids}
-
-        tally = {uid: 0 for uid in alive_ids}
-        for vs in active_votes.values():
-            for v in vs: 
-                # Strict check: only count votes for ALIVE targets
-                if v in tally: 
-                    tally[v] += 1
-                else:
-                    logger.warning(f"Guild {self.guild_id}: Vote for invalid/dead target {v} ignored.")
+        alive_ids = self._alive_ids
+        tally = Counter(dict.fromkeys(alive_ids, 0))
+        for voter_id, vs in self.votes.items():
+            # Skip votes from dead people
+            if voter_id not in alive_ids: continue
+            # Strict check: only count votes for ALIVE targets
+            valid = [v for v in vs if v in alive_ids]
+            if len(valid) != len(vs):
+                logger.warning(f"Guild {self.guild_id}: {len(vs) - len(valid)} vote(s) for invalid/dead targets ignored.")
+            tally.update(valid)
         
         results = sorted(tally.items(), key=lambda x: x[1], reverse=True)
         if not results: return [], "No votes", False
@@ -368,9 +469,21 @@ class GameState:
                 if p and p.alive: eliminated.append(p)
                 text = T("msg.majority_decision", self.lang)
         
-        asyncio.create_task(SaveManager.request())
+        SaveManager.request()
         return eliminated, text, is_draw
 
+    def participant_stats(self) -> List[Tuple[int, str, Dict[str, int]]]:
+        """Builds the end-of-game stat updates for every participant."""
+        sex0 = T("data", self.lang)["sexes"][0]
+        entries = []
+        for p in self.players:
+            # Ages are generated as digit strings; anything else counts as the default
+            age = p.cards.get('age')
+            age_val = int(age) if isinstance(age, str) and age.isdecimal() else 25
+            sex_idx = 0 if p.cards.get('sex') == sex0 else 1
+            entries.append((p.user_id, "game_start", {"age": age_val, "sex_idx": sex_idx}))
+        return entries
+
     def calculate_ending(self) -> str:
         E = T("endings", self.lang)
         return E["neutral"]
@@ -379,7 +492,7 @@ class GameState:
         if self.phase == GamePhase.FINISHED:
             return discord.Embed(title=T("ui.win_title", self.lang), color=EmbedColors.VICTORY)
 
-        embed = discord.Embed(title="📊 BUNKER DASHBOARD", color=discord.Color.dark_teal())
+        embed = discord.Embed(title="📊 BUNKER DASHBOARD", color=EmbedColors.GAME_INFO)
         
         host_lbl = T('ui.host_label', self.lang)
         pl_lbl = T('ui.players_label', self.lang)
@@ -396,53 +509,77 @@ class GameState:
         ptxt = ""
         titles = T("card_titles", self.lang)
         for p in self.players:
-            status = "🟢" if p.alive else "💀"
+            status = _ALIVE_ICON[p.alive]
             if not p.alive:
                 ptxt += f"{status} ~~{p.name}~~\n\n"
                 continue
             
-            revealed = [f"> **{titles.get(k, k)}**: {v}" for k,v in p.cards.items() if p.opened.get(k)]
+            mask = p.opened_mask
+            revealed = [f"> **{titles.get(k, k)}**: {p.cards[k]}" for k, bit in CARD_BITS.items() if mask & bit and k in p.cards]
             ptxt += f"{status} **{p.name}**\n" + ("\n".join(revealed) if revealed else "> *???*") + "\n\n"
 
         if len(ptxt) > 1024: ptxt = ptxt[:1020] + "..."
         embed.add_field(name="Players", value=ptxt, inline=False)
         return embed
 
+    async def fetch_board_message(self, bot: commands.Bot) -> Optional[discord.Message]:
+        """Fetches and caches the board message so later updates are a single edit."""
+        if self.board_message or not self.channel_id or not self.board_msg_id:
+            return self.board_message
+        
+        try:
+            ch = bot.get_channel(self.channel_id)
+            if ch: 
+                self.board_message = await asyncio.wait_for(ch.fetch_message(self.board_msg_id), timeout=FETCH_TIMEOUT)
+            else:
+                logger.warning(f"Guild {self.guild_id}: Channel not found for update_board.")
+        except asyncio.TimeoutError:
+            logger.warning(f"Guild {self.guild_id}: Timed out fetching board msg.")
+        except discord.NotFound:
+            logger.warning(f"Guild {self.guild_id}: Board message not found.")
+            self.board_msg_id = None
+        except discord.Forbidden:
+            logger.warning(f"Guild {self.guild_id}: Permission denied for board update.")
+        except discord.HTTPException as e:
+            if e.status == 429:
+                logger.warning(f"Guild {self.guild_id}: Rate limited fetching board msg. Retry in {e.retry_after:.2f}s")
+            else:
+                logger.error(f"Guild {self.guild_id}: HTTP error fetching board msg: {e}")
+        except Exception as e:
+            logger.error(f"Guild {self.guild_id}: Fetch error in update_board: {e}")
+        return self.board_message
+
+    def schedule_board_update(self, bot: commands.Bot) -> None:
+        """Coalesces board refreshes: at most one edit per BOARD_DEBOUNCE window."""
+        if self._board_pending: return
+        self._board_pending = True
+        spawn(self._debounced_board_update(bot))
+
+    async def _debounced_board_update(self, bot: commands.Bot) -> None:
+        await asyncio.sleep(BOARD_DEBOUNCE)
+        self._board_pending = False
+        # end_game deletes the board
+        if self.phase == GamePhase.FINISHED: return
+        await self.update_board(bot)
+
     async def update_board(self, bot: commands.Bot) -> None:
         if not self.channel_id or not self.board_msg_id: return
         
         if not self.board_message:
-            try:
-                ch = bot.get_channel(self.channel_id)
-                if ch: 
-                    self.board_message = await ch.fetch_message(self.board_msg_id)
-                else:
-                    logger.warning(f"Guild {self.guild_id}: Channel not found for update_board.")
-                    return
-            except discord.NotFound:
-                logger.warning(f"Guild {self.guild_id}: Board message not found.")
-                self.board_msg_id = None
-                return
-            except discord.Forbidden:
-                logger.warning(f"Guild {self.guild_id}: Permission denied for board update.")
-                return
-            except discord.HTTPException as e:
-                if e.status == 429:
-                    logger.warning(f"Guild {self.guild_id}: Rate limited fetching board msg. Retry in {e.retry_after:.2f}s")
-                else:
-                    logger.error(f"Guild {self.guild_id}: HTTP error fetching board msg: {e}")
-                return
-            except Exception as e:
-                logger.error(f"Guild {self.guild_id}: Fetch error in update_board: {e}")
-                return
+            await self.fetch_board_message(bot)
 
         if self.board_message:
+            embed = self.generate_board_embed()
+            payload = embed.to_dict()
+            if payload == self._board_payload: return
             try: 
-                await self.board_message.edit(embed=self.generate_board_embed())
+                await self.board_message.edit(embed=embed)
+                self._board_payload = payload
             except discord.NotFound:
                 logger.warning(f"Guild {self.guild_id}: Board message deleted during edit.")
                 self.board_message = None
                 self.board_msg_id = None
+                self._board_payload = None
             except discord.HTTPException as e:
                 if e.status == 429:
                     logger.warning(f"Guild {self.guild_id}: Rate limited editing board. Retry in {e.retry_after:.2f}s")
@@ -452,30 +589,26 @@ class GameState:
                 logger.error(f"Guild {self.guild_id}: Edit error in update_board: {e}")
 
 # --- Exposed functions to replace old direct calls ---
-async def save_active_games() -> None:
-    await SaveManager.request()
+def request_save() -> None:
+    """Marks game state dirty; the background writer persists it shortly."""
+    SaveManager.request()
 
 async def delete_active_game(guild_id: int) -> None:
     if guild_id in games:
         del games[guild_id]
         await SaveManager.force()
 
-async def load_active_games_from_disk() -> None:
-    if not os.path.exists(GAME_DB_FILE): return
-    try:
-        from .database import load_raw_active_games
-        data = await load_raw_active_games()
-        for gid_str, g_data in data.items():
-            gid = int(gid_str)
-            try:
-                game = GameState.from_dict(gid, g_data)
-                # Validation Step
-                if game.validate():
-                    async with _games_lock:
-                        games[gid] = game
-                else:
-                    logger.warning(f"Skipping corrupted game state for guild {gid}")
-            except Exception as e:
-                logger.error(f"Failed to recover game {gid}: {e}")
-    except Exception as e:
-        logger.error(f"Game Load Error: {e}")
\ No newline at end of file
+async def restore_active_games(data: Dict[str, Any]) -> None:
+    """Rebuilds GameState objects from already-parsed save data."""
+    for gid_str, g_data in data.items():
+        gid = int(gid_str)
+        try:
+            game = GameState.from_dict(gid, g_data)
+            # Validation Step
+            if game.validate():
+                async with _games_lock:
+                    games[gid] = game
+            else:
+                logger.warning(f"Skipping corrupted game state for guild {gid}")
+        except Exception as e:
+            logger.error(f"Failed to recover game {gid}: {e}")
@@ -1,12 +1,57 @@
-import json
 import os
 import asyncio
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import discord
+import orjson
 from .settings import logger, LANG_FILE
 from .database import get_server_lang
 
 # Global dictionary initialized once
 LANGUAGES = {}
 
+# /language dropdown options, rebuilt on every load
+LANG_OPTIONS: List[discord.SelectOption] = []
+
+# Guide item dropdowns per (lang, category), rebuilt on every load
+GUIDE_OPTIONS: Dict[Tuple[str, str], Tuple[discord.SelectOption, ...]] = {}
+
+# Guide category value -> language file section it lists
+GUIDE_SOURCES = (("phobia", "phobias"), ("health", "health"))
+
+# Guide category dropdown per lang: (placeholder, options), rebuilt on every load
+GUIDE_CATEGORIES: Dict[str, Tuple[str, Tuple[discord.SelectOption, ...]]] = {}
+
+def build_guide_categories(g_txt: Any) -> Tuple[str, Tuple[discord.SelectOption, ...]]:
+    if not isinstance(g_txt, dict): g_txt = {}
+    options = (
+        discord.SelectOption(label=g_txt.get("phobia_label", "Phobias"), value="phobia", emoji="😱"),
+        discord.SelectOption(label=g_txt.get("health_label", "Health"), value="health", emoji="🏥"),
+    )
+    return g_txt.get("select_category", "Select Category"), options
+
+# lru_cache'd helpers that bake translated text in; cleared on every load (see lang_cache)
+_LANG_CACHES: List[Any] = []
+
+def lang_cache(maxsize: Optional[int] = 32):
+    """lru_cache for helpers built from T() output, reset whenever languages are (re)loaded."""
+    def decorator(fn):
+        cached = lru_cache(maxsize=maxsize)(fn)
+        _LANG_CACHES.append(cached)
+        return cached
+    return decorator
+
+# Flat lookup table built at load time: ("en", "ui.host_label") -> value
+# Every node is stored, so subtrees like T("data", lang) are a single lookup too
+_FLAT: Dict[Tuple[str, str], Any] = {}
+
+def _flatten(lang: str, node: Dict[str, Any], out: Dict[Tuple[str, str], Any], prefix: str = "") -> None:
+    for k, v in node.items():
+        path = f"{prefix}.{k}" if prefix else k
+        out[(lang, path)] = v
+        if isinstance(v, dict):
+            _flatten(lang, v, out, path)
+
 async def load_languages():
     """Asynchronously load language data from disk into the global dict."""
     if not os.path.exists(LANG_FILE):
@@ -14,17 +59,36 @@ async def load_languages():
         return
 
     def _read():
-        with open(LANG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(LANG_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+        flat = {}
+        for lang, tree in data.items():
+            if isinstance(tree, dict):
+                _flatten(lang, tree, flat)
+        return data, flat
 
     try:
-        data = await asyncio.to_thread(_read)
+        data, flat = await asyncio.to_thread(_read)
         # FIX: Update existing dictionary instead of reassigning variable
         # This ensures imports in other files see the changes
         LANGUAGES.clear()
         LANGUAGES.update(data)
+        _FLAT.clear()
+        _FLAT.update(flat)
+        LANG_OPTIONS[:] = [discord.SelectOption(label=d.get("name", code), value=code) for code, d in LANGUAGES.items()]
+        GUIDE_OPTIONS.clear()
+        GUIDE_CATEGORIES.clear()
+        for cached in _LANG_CACHES:
+            cached.cache_clear()
+        for code, d in LANGUAGES.items():
+            GUIDE_CATEGORIES[code] = build_guide_categories(d.get("guide"))
+            for category, section in GUIDE_SOURCES:
+                src = d.get(section)
+                if isinstance(src, dict):
+                    # Discord allows at most 25 options per select
+                    GUIDE_OPTIONS[(code, category)] = tuple(discord.SelectOption(label=k) for k in sorted(src)[:25])
         logger.info(f"Languages loaded successfully. Available: {list(LANGUAGES.keys())}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.critical(f"Failed to parse {LANG_FILE}: {e}")
     except Exception as e:
         logger.critical(f"Error loading languages: {e}")
@@ -40,32 +104,25 @@ def T(key: str, ctx_or_lang, **kwargs):
     elif hasattr(ctx_or_lang, "guild") and ctx_or_lang.guild:
         lang = get_server_lang(ctx_or_lang.guild.id)
     
-    # Try to get data for the requested language
-    # Default to UK if language itself is missing from file
-    data = LANGUAGES.get(lang, LANGUAGES.get("uk", {}))
-    
-    keys = key.split(".")
+    # A language missing from the file falls back to UK silently; only missing keys are worth a warning
+    if lang not in LANGUAGES:
+        lang = "uk"
     
-    for k in keys:
-        if isinstance(data, dict) and k in data:
-            data = data[k]
-        else:
-            # Key missing in target language
-            if lang != "uk":
-                logger.warning(f"Translation missing for key '{key}' in language '{lang}', falling back to UK")
-            
-            # Fallback to UK (Default)
-            data = LANGUAGES.get("uk", {})
-            for fk in keys:
-                if isinstance(data, dict) and fk in data: 
-                    data = data[fk]
-                else: 
-                    return f"[{key}]" # Missing key even in default language
-            break
+    data = _FLAT.get((lang, key))
+    if data is None:
+        # Key missing in target language
+        if lang != "uk":
+            logger.warning(f"Translation missing for key '{key}' in language '{lang}', falling back to UK")
+        
+        # Fallback to UK (Default)
+        data = _FLAT.get(("uk", key))
+        if data is None:
+            return f"[{key}]" # Missing key even in default language
     
-    if isinstance(data, str):
+    # Most strings take no parameters; skip the format machinery for those
+    if kwargs and isinstance(data, str):
         try:
-            return data.format(**kwargs)
+            return data.format_map(kwargs)
         except Exception as e:
             logger.error(f"Formatting error for key '{key}': {e}")
             return data
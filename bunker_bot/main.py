@@ -3,58 +3,153 @@ from discord.ext import commands
 from discord import app_commands
 from typing import Optional
 import asyncio
+import hashlib
+from pathlib import Path
+from operator import attrgetter
+import orjson
 
-from .settings import BOT_TOKEN, logger, EmbedColors
-from .database import load_user_db, load_raw_active_games, get_server_lang, get_user_data, get_server_stats, reset_user_stats
-from .game import games, GameState, load_active_games_from_disk, save_active_games, GamePhase
-from .ui import JoinView, Dashboard, ProfileView, CloseView, LangSelect, safe_response, check_bot_perms, VoteView, tech_embed
-from .i18n import T, LANGUAGES, load_languages
+from .settings import BOT_TOKEN, SYNC_HASH_FILE, logger, EmbedColors
+from .database import load_user_db, flush_user_db, load_raw_active_games, get_server_lang, get_user_data, get_server_stats, reset_user_stats
+from .game import games, GameState, SaveManager, restore_active_games, request_save, GamePhase
+from .ui import JoinView, Dashboard, register_dashboard, ProfileView, CloseView, LangSelect, safe_response, check_bot_perms, VoteView, tech_embed, lobby_embed
+from .i18n import T, LANGUAGES, LANG_OPTIONS, load_languages
 
-intents = discord.Intents.default()
-intents.message_content = True 
-bot = commands.Bot(command_prefix="!", intents=intents)
+# Everything runs through interactions; only the guild/channel cache is needed
+intents = discord.Intents.none()
+intents.guilds = True
+class BunkerBot(commands.Bot):
+    async def close(self) -> None:
+        # Flush game state so a restart recovers the latest moves, not the last debounced write
+        try:
+            await asyncio.gather(SaveManager.force(), flush_user_db())
+        except Exception as e:
+            logger.error(f"Shutdown save failed: {e}")
+        await super().close()
 
-@bot.event
-async def on_ready():
-    # 1. Load User DB
-    await load_user_db()
+bot = BunkerBot(command_prefix="!", intents=intents)
+
+# Recovered games per event-loop yield during view registration
+VIEW_REGISTER_BATCH = 50
+
+# Cooldown bucket key: one bucket per guild
+_guild_key = attrgetter("guild_id")
+
+# on_ready fires again on every reconnect; state is loaded from disk only the first time
+_state_recovered = False
+
+async def recover_state() -> int:
+    """Loads databases and re-registers persistent views for recovered games."""
+    # 1. Read User DB, saved games and Languages concurrently (parsing runs in worker threads).
+    #    Languages MUST be loaded before recovering games, which the gather guarantees.
+    _, games_raw, _ = await asyncio.gather(load_user_db(), load_raw_active_games(), load_languages())
     
-    # 2. Load Languages (Async) - MUST BE BEFORE RECOVERING GAMES
-    await load_languages()
+    # 2. Recover Active Games (needs the user DB and languages in memory)
+    try:
+        await restore_active_games(games_raw)
+    except Exception as e:
+        logger.error(f"Game Load Error: {e}")
     
-    # 3. Recover Active Games
-    await load_active_games_from_disk()
+    # Re-register persistent views in chunks, yielding between them so the
+    # gateway heartbeat keeps running while many games are recovered.
+    # (Views need the running loop, so they cannot be built in a worker thread.)
+    # Shared per-language dashboards cover every game started since they were introduced
+    for lang in LANGUAGES:
+        register_dashboard(bot, lang)
     
-    recovered_count = 0
-    # Re-register persistent views
-    for gid, game in games.items():
+    pending = list(games.items())
+    for i, (gid, game) in enumerate(pending, 1):
         bot.add_view(JoinView(game.lang, gid))
-        bot.add_view(Dashboard(game.lang, gid))
+        if game.legacy_dash:
+            bot.add_view(Dashboard(game.lang, gid))
         
         # If game was in VOTING, we must also recover the VoteView to allow voting to continue
         if game.phase == GamePhase.VOTING:
-            alive = game.alive_players()
             mx = 2 if game.double_elim_next else 1
-            bot.add_view(VoteView(alive, mx, game.lang, gid))
-            
-        recovered_count += 1
+            vote_view = VoteView(game.alive_players(), mx, game.lang, gid)
+            # No message handle survives a restart, so the vote cannot auto-resolve;
+            # it stays open (persistent) until the host ends it
+            vote_view.timeout = None
+            bot.add_view(vote_view)
+        
+        if i % VIEW_REGISTER_BATCH == 0:
+            await asyncio.sleep(0)
+    
+    # Prefetch board messages so the first update after restart is a plain edit
+    await asyncio.gather(*(game.fetch_board_message(bot) for game in games.values()))
+    return len(games)
 
+async def sync_commands() -> None:
+    """Syncs the command tree only when it differs from the last synced version.
+    
+    Delete the hash file to force a sync (e.g. after switching bot applications).
+    """
+    payload = orjson.dumps([c.to_dict(bot.tree) for c in bot.tree.get_commands()], option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    hash_file = Path(SYNC_HASH_FILE)
+    try:
+        previous = hash_file.read_text()
+    except FileNotFoundError:
+        previous = ""
+    
+    if digest == previous:
+        logger.info("Command tree unchanged, skipping sync.")
+        return
+    
     await bot.tree.sync()
+    hash_file.write_text(digest)
+
+@bot.event
+async def on_ready():
+    global _state_recovered
+    SaveManager.start()
+    if _state_recovered:
+        # Reconnect: live games and pending DB changes are newer than the files on disk
+        await sync_commands()
+        logger.info(f"Bot reconnected as {bot.user}.")
+        return
+    _state_recovered = True
+    # Command sync is a network round trip; overlap it with local recovery
+    recovered_count, _ = await asyncio.gather(recover_state(), sync_commands())
     logger.info(f"Bot logged in as {bot.user}. Recovered {recovered_count} games.")
 
+class NoGame(app_commands.AppCommandError):
+    """Raised by commands that need an active game in the current guild."""
+
+def require_game(interaction: discord.Interaction) -> GameState:
+    """Returns the guild's active game or raises NoGame."""
+    try:
+        return games[interaction.guild.id]
+    except (KeyError, AttributeError):
+        raise NoGame()
+
+async def _on_no_game(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    await safe_response(interaction, embed=tech_embed("❌ No active game in this server.", "error"), ephemeral=True)
+
+async def _on_cooldown(interaction: discord.Interaction, error: app_commands.CommandOnCooldown):
+    await safe_response(interaction, embed=tech_embed(f"Cooldown: {error.retry_after:.1f}s", "error"), ephemeral=True)
+
+async def _on_missing_perms(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    await safe_response(interaction, embed=tech_embed("❌ You do not have permission to use this command.", "error"), ephemeral=True)
+
+async def _on_unknown_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    logger.error(f"Command Error: {error}")
+    try: await safe_response(interaction, embed=tech_embed("❌ Internal Error.", "error"), ephemeral=True)
+    except discord.HTTPException: pass
+
+# Exact-type dispatch; anything not listed (including subclasses) is an internal error
+_ERROR_HANDLERS = {
+    NoGame: _on_no_game,
+    app_commands.CommandOnCooldown: _on_cooldown,
+    app_commands.MissingPermissions: _on_missing_perms,
+}
+
 @bot.tree.error
 async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
-    if isinstance(error, app_commands.CommandOnCooldown):
-        await safe_response(interaction, embed=tech_embed(f"Cooldown: {error.retry_after:.1f}s", "error"), ephemeral=True)
-    elif isinstance(error, app_commands.MissingPermissions):
-        await safe_response(interaction, embed=tech_embed("❌ You do not have permission to use this command.", "error"), ephemeral=True)
-    else:
-        logger.error(f"Command Error: {error}")
-        try: await safe_response(interaction, embed=tech_embed("❌ Internal Error.", "error"), ephemeral=True)
-        except: pass
+    handler = _ERROR_HANDLERS.get(type(error), _on_unknown_error)
+    await handler(interaction, error)
 
 @bot.tree.command(name="language", description="Change language")
-@app_commands.checks.cooldown(1, 30.0, key=lambda i: (i.guild_id)) # 1 use per 30s per guild
+@app_commands.checks.cooldown(1, 30.0, key=_guild_key) # 1 use per 30s per guild
 async def language(interaction: discord.Interaction):
     if not interaction.guild: return
     
@@ -66,8 +161,8 @@ async def language(interaction: discord.Interaction):
         await safe_response(interaction, embed=tech_embed("❌ Error: Language file is empty or missing.", "error"), ephemeral=True)
         return
 
-    # Create options based on loaded languages
-    options = [discord.SelectOption(label=data.get("name", code), value=code) for code, data in LANGUAGES.items()]
+    # Options are built once by load_languages
+    options = LANG_OPTIONS
     
     if not options:
         await safe_response(interaction, embed=tech_embed("❌ No languages available.", "error"), ephemeral=True)
@@ -102,10 +197,10 @@ async def create(interaction: discord.Interaction, players: int):
     
     games[interaction.guild.id] = new_game
     
-    # Save state immediately (non-blocking)
-    asyncio.create_task(save_active_games())
+    # Queue a save (non-blocking, coalesced by the writer)
+    request_save()
     
-    emb = discord.Embed(title=T("ui.lobby_title", lang), description=f"{T('ui.host_label', lang)} {interaction.user.mention}\n{T('ui.players_label', lang)} 1/{players}", color=EmbedColors.LOBBY)
+    emb = lobby_embed(lang, interaction.user.id, 1, players)
     
     # CRITICAL FIX: ephemeral=False ensures everyone can see the lobby and join
     await safe_response(interaction, embed=emb, view=JoinView(lang, interaction.guild.id), ephemeral=False)
@@ -124,30 +219,35 @@ async def profile(interaction: discord.Interaction, user: Optional[discord.User]
     nm = d["name"] if d["name"] else target.display_name
     
     base_title = T("profile.title", lang, name=nm)
-    emb = discord.Embed(title=f"{base_title} (Global)", color=EmbedColors.INFO)
-    
-    emb.set_thumbnail(url=target.display_avatar.url)
-    
-    emb.add_field(name=T("profile.games", lang), value=str(d["games"]), inline=True)
-    emb.add_field(name=T("profile.wins", lang), value=str(d["wins"]), inline=True)
     
     winrate = 0
     if d["games"] > 0: winrate = (d["wins"] / d["games"]) * 100
-    emb.add_field(name=T("profile.winrate", lang), value=f"{winrate:.1f}%", inline=True)
 
     # Sex Stats Display
     sex_stats = d.get("sex_stats", {"m": 0, "f": 0})
     sex_text = f"♂️ {sex_stats.get('m', 0)} | ♀️ {sex_stats.get('f', 0)}"
-    emb.add_field(name=T("profile.sex", lang), value=sex_text, inline=True)
     
     # Average Age Display
     avg_age = 0
     if d["games"] > 0 and "total_age" in d:
         avg_age = d["total_age"] / d["games"]
-    emb.add_field(name=T("profile.age", lang), value=f"{avg_age:.1f}", inline=True)
     
     srv_games = get_server_stats(interaction.guild.id)
-    emb.set_footer(text=T("profile.server_stats", lang, count=srv_games))
+    
+    # Built in one shot from a payload dict instead of a chain of add_field calls
+    emb = discord.Embed.from_dict({
+        "title": f"{base_title} (Global)",
+        "color": EmbedColors.INFO.value,
+        "thumbnail": {"url": target.display_avatar.url},
+        "fields": [
+            {"name": T("profile.games", lang), "value": str(d["games"]), "inline": True},
+            {"name": T("profile.wins", lang), "value": str(d["wins"]), "inline": True},
+            {"name": T("profile.winrate", lang), "value": f"{winrate:.1f}%", "inline": True},
+            {"name": T("profile.sex", lang), "value": sex_text, "inline": True},
+            {"name": T("profile.age", lang), "value": f"{avg_age:.1f}", "inline": True},
+        ],
+        "footer": {"text": T("profile.server_stats", lang, count=srv_games)},
+    })
     
     is_owner = (target.id == interaction.user.id)
     await safe_response(interaction, embed=emb, view=ProfileView(lang, is_owner), ephemeral=True)
@@ -155,10 +255,7 @@ async def profile(interaction: discord.Interaction, user: Optional[discord.User]
 @bot.tree.command(name="dossier", description="In-game dossier")
 @app_commands.checks.cooldown(1, 5.0) # 1 use per 5s per user
 async def dossier(interaction: discord.Interaction):
-    game = games.get(interaction.guild.id)
-    if not game:
-        await safe_response(interaction, embed=tech_embed("No active game.", "error"), ephemeral=True)
-        return
+    game = require_game(interaction)
     p = game.get_player(interaction.user.id)
     lang = get_server_lang(interaction.guild.id)
     if p:
@@ -168,26 +265,32 @@ async def dossier(interaction: discord.Interaction):
 
 # --- ADMIN COMMANDS ---
 
-@bot.tree.command(name="admin_endgame", description="Force end the current game (Admin)")
-@app_commands.checks.has_permissions(administrator=True)
+class AdminGroup(app_commands.Group):
+    """/admin subcommands. The administrator check runs once for the whole group."""
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if not interaction.permissions.administrator:
+            raise app_commands.MissingPermissions(["administrator"])
+        return True
+
+admin = AdminGroup(name="admin", description="Admin commands", default_permissions=discord.Permissions(administrator=True), guild_only=True)
+
+@admin.command(name="endgame", description="Force end the current game (Admin)")
 @app_commands.checks.cooldown(1, 5.0)
 async def admin_endgame(interaction: discord.Interaction):
     if not interaction.guild: return
-    game = games.get(interaction.guild.id)
-    if game:
-        await game.end_game(interaction.client)
-        await safe_response(interaction, embed=tech_embed("✅ Game force-ended by admin.", "success"), ephemeral=True)
-    else:
-        await safe_response(interaction, embed=tech_embed("❌ No active game in this server.", "error"), ephemeral=True)
+    game = require_game(interaction)
+    await game.end_game(interaction.client)
+    await safe_response(interaction, embed=tech_embed("✅ Game force-ended by admin.", "success"), ephemeral=True)
 
-@bot.tree.command(name="admin_reset_stats", description="Reset user stats (Admin)")
-@app_commands.checks.has_permissions(administrator=True)
+@admin.command(name="reset_stats", description="Reset user stats (Admin)")
 @app_commands.checks.cooldown(1, 5.0)
 async def admin_reset_stats(interaction: discord.Interaction, user: discord.User):
     if not interaction.guild: return
     await reset_user_stats(user.id)
     await safe_response(interaction, embed=tech_embed(f"✅ Stats reset for {user.mention}.", "success"), ephemeral=True)
 
+bot.tree.add_command(admin)
+
 def run():
     if BOT_TOKEN:
         bot.run(BOT_TOKEN)
@@ -1,8 +1,11 @@
 import os
-import json
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import discord
+import orjson
 
 # =========================
 #  LOGGING SETUP
@@ -16,10 +19,16 @@ def setup_logging():
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(log_formatter)
     
+    # File/console writes (and log rotation) happen on the listener thread,
+    # so logging from async handlers never blocks the event loop
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     logger = logging.getLogger("bunker_bot")
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    logger.addHandler(QueueHandler(log_queue))
     return logger
 
 logger = setup_logging()
@@ -27,15 +36,15 @@ logger = setup_logging()
 # =========================
 #  CONFIG LOADER
 # =========================
-if not os.path.exists("config.json"):
-    with open("config.json", "w") as f:
-        json.dump({"token": ""}, f)
+CONFIG_FILE = Path("config.json")
 
-with open("config.json", "r") as f:
-    try:
-        CONFIG = json.load(f)
-    except json.JSONDecodeError:
-        CONFIG = {}
+try:
+    CONFIG = orjson.loads(CONFIG_FILE.read_bytes())
+except FileNotFoundError:
+    CONFIG = {"token": ""}
+    CONFIG_FILE.write_bytes(orjson.dumps(CONFIG))
+except orjson.JSONDecodeError:
+    CONFIG = {}
 
 BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN") or CONFIG.get("token")
 
@@ -45,12 +54,16 @@ BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN") or CONFIG.get("token")
 DB_FILE = "users.json"
 GAME_DB_FILE = "active_games.json"
 LANG_FILE = "languages.json"
+SYNC_HASH_FILE = ".sync_hash"
 
 # Timeouts (in seconds)
 LOBBY_TIMEOUT = 3600        # 1 hour
-DASHBOARD_TIMEOUT = 7200    # 2 hours
 VOTE_TIMEOUT = 900          # 15 minutes (Increased for better UX)
 EPHEMERAL_VIEW_TIMEOUT = 180 # 3 minutes
+FETCH_TIMEOUT = 2           # Upper bound for message fetches
+SAVE_DEBOUNCE = 0.5         # Coalescing window for game saves
+BOARD_DEBOUNCE = 0.5        # Coalescing window for board edits
+VOTE_STATUS_DEBOUNCE = 0.3  # Coalescing window for vote counter edits
 
 # Message Lifetimes (in seconds)
 BRIEF_MSG_LIFETIME = 3
@@ -1,52 +1,111 @@
 import discord
 import asyncio
 import random
-from .settings import logger, VOTE_TIMEOUT, EPHEMERAL_VIEW_TIMEOUT, BRIEF_MSG_LIFETIME, ANNOUNCEMENT_LIFETIME, RESULT_MSG_LIFETIME, EmbedColors
-from .i18n import T
-from .database import set_server_lang, get_user_data, set_custom_name, update_user_stats, save_user_db_data
-from .game import games, GamePhase, Player, save_active_games
+from functools import lru_cache, wraps
+from typing import Dict, List, Optional, Set, Tuple
+from .settings import logger, VOTE_TIMEOUT, EPHEMERAL_VIEW_TIMEOUT, BRIEF_MSG_LIFETIME, ANNOUNCEMENT_LIFETIME, RESULT_MSG_LIFETIME, VOTE_STATUS_DEBOUNCE, EmbedColors
+from .i18n import T, lang_cache, GUIDE_OPTIONS, GUIDE_CATEGORIES, build_guide_categories
+from .database import set_server_lang, set_custom_name, update_user_stats_bulk
+from .game import games, GamePhase, CARD_BITS, ALL_CARDS_MASK, guild_lock, request_save, delete_active_game, spawn
 
 def get_game_safe(interaction: discord.Interaction):
     if not interaction.guild: return None
     return games.get(interaction.guild.id)
 
+# Permissions the bot needs in the game channel, as a bitmask
+_REQUIRED_PERMS = discord.Permissions(send_messages=True, embed_links=True, read_message_history=True).value
+
 def check_bot_perms(interaction: discord.Interaction) -> bool:
     if not interaction.guild: return True
     if not interaction.channel: return True
-    perms = interaction.channel.permissions_for(interaction.guild.me)
-    return perms.send_messages and perms.embed_links and perms.read_message_history
+    # Discord sends the bot's resolved channel permissions with every interaction
+    return (interaction.app_permissions.value & _REQUIRED_PERMS) == _REQUIRED_PERMS
 
-async def auto_del(interaction, delay=3):
-    await asyncio.sleep(delay)
-    try: await interaction.delete_original_response()
-    except: pass
+async def _quiet(coro):
+    try: await coro
+    except discord.HTTPException: pass
 
-async def safe_response(interaction, content=None, embed=None, view=None, ephemeral=True, delete_after=None):
+def delete_later(delete, delay=BRIEF_MSG_LIFETIME) -> None:
+    """Calls the `delete` coroutine function after `delay` seconds.
+    A loop timer is scheduled instead of a sleeping task, so nothing runs until it fires."""
+    asyncio.get_running_loop().call_later(delay, lambda: spawn(_quiet(delete())))
+
+async def safe_send(interaction, content=None, embed=None, view=None, ephemeral=True, delete_after=None):
+    """Initial response for an interaction that has not been acknowledged yet."""
     try:
-        if interaction.response.is_done():
-            msg = await interaction.followup.send(content=content, embed=embed, view=view, ephemeral=ephemeral, wait=True)
-            if delete_after:
-                await asyncio.sleep(delete_after)
-                try: await msg.delete()
-                except: pass
-        else:
-            await interaction.response.send_message(content=content, embed=embed, view=view, ephemeral=ephemeral, delete_after=delete_after)
-    except Exception as e:
-        if "Unknown interaction" not in str(e) and "404 Not Found" not in str(e):
-             logger.error(f"UI Error in safe_response: {e}")
+        await interaction.response.send_message(content=content, embed=embed, view=view, ephemeral=ephemeral, delete_after=delete_after)
+    # Unknown interaction: the 3s window passed, nothing left to answer
+    except discord.NotFound: pass
+    except (discord.HTTPException, discord.InteractionResponded) as e:
+        logger.error(f"UI Error in safe_send: {e}")
+
+async def safe_followup(interaction, content=None, embed=None, view=None, ephemeral=True, delete_after=None):
+    """Followup for an interaction that was already responded to or deferred.
+    Returns the sent message, or None on failure."""
+    # Followup tokens live 15 minutes; skip the request once it is gone
+    if interaction.is_expired(): return None
+    try:
+        msg = await interaction.followup.send(content=content, embed=embed, view=view, ephemeral=ephemeral, wait=True)
+        if delete_after:
+            delete_later(msg.delete, delete_after)
+        return msg
+    except discord.NotFound: pass
+    except discord.HTTPException as e:
+        logger.error(f"UI Error in safe_followup: {e}")
+
+async def safe_response(interaction, content=None, embed=None, view=None, ephemeral=True, delete_after=None):
+    """Picks safe_send or safe_followup by the interaction's state.
+    Handlers that defer up front call safe_followup directly."""
+    if interaction.response.is_done():
+        return await safe_followup(interaction, content, embed, view, ephemeral, delete_after)
+    await safe_send(interaction, content, embed, view, ephemeral, delete_after)
+
+def guild_serialized(callback):
+    """Acks the interaction, then runs the callback under its guild's lock.
+    Slow actions on one game apply in order without holding up other guilds."""
+    @wraps(callback)
+    async def wrapper(self, interaction, *args):
+        await interaction.response.defer()
+        if not interaction.guild:
+            return await callback(self, interaction, *args)
+        async with guild_lock(interaction.guild.id):
+            return await callback(self, interaction, *args)
+    return wrapper
+
+async def run_parallel(*aws) -> None:
+    """Awaits independent Discord/disk calls together; failures are logged, not raised."""
+    for res in await asyncio.gather(*aws, return_exceptions=True):
+        if isinstance(res, Exception):
+            logger.error(f"UI Error in parallel call: {res}")
 
 # --- HELPERS ---
+# Status embeds repeat constantly ("only host", "vote accepted"...); callers must not mutate the result
+@lru_cache(maxsize=256)
 def tech_embed(text: str, type="success") -> discord.Embed:
     color = EmbedColors.SUCCESS if type == "success" else EmbedColors.ERROR
     if type == "info": color = EmbedColors.INFO
     return discord.Embed(description=text, color=color)
 
+# Close button label and "closed" embed per language; identical for every ephemeral, so built once
+@lang_cache(maxsize=32)
+def _close_template(lang: str) -> Tuple[str, discord.Embed]:
+    return T("ui.close_btn", lang), tech_embed(T("msg.closed", lang), "info")
+
+@lang_cache(maxsize=None)
+def _lobby_labels(lang: str) -> Tuple[str, str, str]:
+    return T("ui.lobby_title", lang), T("ui.host_label", lang), T("ui.players_label", lang)
+
+def lobby_embed(lang: str, host_id: int, joined: int, max_players: int) -> discord.Embed:
+    title, host_lbl, players_lbl = _lobby_labels(lang)
+    return discord.Embed(title=title, description=f"{host_lbl} <@{host_id}>\n{players_lbl} {joined}/{max_players}", color=EmbedColors.LOBBY)
+
 class CloseBtn(discord.ui.Button):
     def __init__(self, lang):
-        super().__init__(label=T("ui.close_btn", lang), style=discord.ButtonStyle.danger, custom_id="bunker:close:generic") 
+        self.lang = lang
+        super().__init__(label=_close_template(lang)[0], style=discord.ButtonStyle.danger, custom_id="bunker:close:generic") 
     async def callback(self, interaction):
-        await interaction.response.edit_message(content=None, embed=tech_embed(T("msg.closed", self.view.lang if hasattr(self.view, "lang") else "uk"), "info"), view=None)
-        asyncio.create_task(auto_del(interaction))
+        await interaction.response.edit_message(content=None, embed=_close_template(self.lang)[1], view=None)
+        delete_later(interaction.delete_original_response)
 
 class CloseView(discord.ui.View):
     def __init__(self, lang="uk"):
@@ -81,16 +140,16 @@ class NameModal(discord.ui.Modal):
              return
 
         await set_custom_name(interaction.user.id, safe_name)
+        # Reply before the board edit: that may need a message fetch and must not eat the ack window
+        await safe_send(interaction, embed=tech_embed(T("msg.name_changed", self.lang, name=safe_name), "success"), ephemeral=True)
         
         game = get_game_safe(interaction)
         if game:
             p = game.get_player(interaction.user.id)
             if p: 
                 p.name = safe_name
-                await game.update_board(interaction.client)
-                asyncio.create_task(save_active_games())
-        
-        await safe_response(interaction, embed=tech_embed(T("msg.name_changed", self.lang, name=safe_name), "success"), ephemeral=True)
+                request_save()
+                game.schedule_board_update(interaction.client)
 
 class ProfileView(discord.ui.View):
     def __init__(self, lang, is_owner):
@@ -104,54 +163,67 @@ class ProfileView(discord.ui.View):
     async def change_name(self, interaction):
         await interaction.response.send_modal(NameModal(self.lang))
 
+@lang_cache(maxsize=32)
+def _card_option_templates(lang: str) -> Tuple[discord.SelectOption, Dict[str, discord.SelectOption]]:
+    """The "reveal all" option and every still-closed card option for a language.
+    These never depend on the player, so all reveal menus share them."""
+    titles = T("card_titles", lang)
+    reveal_all = discord.SelectOption(label=T("ui.reveal_all_opt", lang), value="all", description=T("ui.reveal_all_desc", lang))
+    closed = {k: discord.SelectOption(label=titles.get(k, k), value=k, description="???", emoji="🔒") for k in CARD_BITS}
+    return reveal_all, closed
+
 class CardSelect(discord.ui.Select):
     def __init__(self, player):
         self.player = player
         lang = player.lang
-        titles = T("card_titles", lang)
-        opts = []
-        opts.append(discord.SelectOption(label=T("ui.reveal_all_opt", lang), value="all", description=T("ui.reveal_all_desc", lang)))
-        
-        for k, v in titles.items():
-            emoji = "✅" if player.opened.get(k) else "🔒"
-            desc = player.cards[k] if player.opened.get(k) else "???"
-            opts.append(discord.SelectOption(label=v, value=k, description=desc, emoji=emoji))
+        titles = player.titles
+        reveal_all, closed = _card_option_templates(lang)
+        
+        # Only opened cards show the player's own value and need a fresh option
+        mask = player.opened_mask
+        opts = [reveal_all]
+        opts.extend(
+            discord.SelectOption(label=titles.get(k, k), value=k, description=player.cards[k], emoji="✅") if mask & bit else closed[k]
+            for k, bit in CARD_BITS.items()
+        )
         super().__init__(placeholder=T("ui.reveal_placeholder", lang), min_values=1, max_values=len(opts), options=opts, custom_id=f"bunker:card_sel:{player.user_id}")
 
+    # Ack first: announcements, the save and the board edit can outlast the 3s deadline
+    @guild_serialized
     async def callback(self, interaction):
         game = get_game_safe(interaction)
         if not game or not self.player.alive: return
         if game.phase == GamePhase.FINISHED:
-            await safe_response(interaction, embed=tech_embed("Game Over", "error"), ephemeral=True)
+            await safe_followup(interaction, embed=tech_embed("Game Over", "error"), ephemeral=True)
             return
 
         lang = self.player.lang
+        # The public announcement and private reply are independent; send them together
+        jobs = []
         
         vals = self.values
         if "all" in vals:
-            for k in self.player.cards: self.player.opened[k] = True
-            await interaction.channel.send(embed=discord.Embed(title=T("msg.reveal_all_public_title", lang, name=self.player.name), description=T("msg.reveal_all_public_desc", lang), color=EmbedColors.VOTING), delete_after=ANNOUNCEMENT_LIFETIME)
+            self.player.open_all()
+            jobs.append(interaction.channel.send(embed=discord.Embed(title=T("msg.reveal_all_public_title", lang, name=self.player.name), description=T("msg.reveal_all_public_desc", lang), color=EmbedColors.VOTING), delete_after=ANNOUNCEMENT_LIFETIME))
         else:
-            titles = T("card_titles", lang)
-            rev = []
-            for v in vals:
-                if not self.player.opened.get(v):
-                    self.player.opened[v] = True
-                    rev.append(f"**{titles.get(v, v)}**: `{self.player.cards[v]}`")
+            player = self.player
+            titles, cards = player.titles, player.cards
+            new_vals = [v for v in vals if v in CARD_BITS and not player.is_open(v)]
+            for v in new_vals: player.open_card(v)
+            rev = [f"**{titles.get(v, v)}**: `{cards[v]}`" for v in new_vals]
             
             if rev:
-                await interaction.channel.send(embed=discord.Embed(title=T("msg.reveal_public_title", lang, name=self.player.name), description="\n".join(rev), color=EmbedColors.SUCCESS), delete_after=ANNOUNCEMENT_LIFETIME)
-                await safe_response(interaction, embed=tech_embed(T("msg.reveal_success", lang), "success"), ephemeral=True, delete_after=BRIEF_MSG_LIFETIME)
+                jobs.append(interaction.channel.send(embed=discord.Embed(title=T("msg.reveal_public_title", lang, name=self.player.name), description="\n".join(rev), color=EmbedColors.SUCCESS), delete_after=ANNOUNCEMENT_LIFETIME))
+                jobs.append(safe_followup(interaction, embed=tech_embed(T("msg.reveal_success", lang), "success"), ephemeral=True, delete_after=BRIEF_MSG_LIFETIME))
             else:
-                await safe_response(interaction, embed=tech_embed(T("msg.reveal_nothing", lang), "info"), ephemeral=True, delete_after=BRIEF_MSG_LIFETIME)
+                jobs.append(safe_followup(interaction, embed=tech_embed(T("msg.reveal_nothing", lang), "info"), ephemeral=True, delete_after=BRIEF_MSG_LIFETIME))
         
-        asyncio.create_task(save_active_games())
+        request_save()
         
-        await asyncio.sleep(BRIEF_MSG_LIFETIME)
-        try: await interaction.delete_original_response()
-        except: pass
+        delete_later(interaction.delete_original_response)
         
-        await game.update_board(interaction.client)
+        game.schedule_board_update(interaction.client)
+        await run_parallel(*jobs)
 
 class RevealView(discord.ui.View):
     def __init__(self, player):
@@ -179,36 +251,30 @@ class RevealView(discord.ui.View):
              await safe_response(interaction, embed=tech_embed("Game Over", "error"), ephemeral=True)
              return
 
-        for k in self.player.cards: self.player.opened[k] = True
-        
-        await interaction.channel.send(
-            embed=discord.Embed(
-                title=T("msg.reveal_all_public_title", self.lang, name=self.player.name), 
-                description=T("msg.reveal_all_public_desc", self.lang), 
-                color=EmbedColors.VOTING
-            ), 
-            delete_after=ANNOUNCEMENT_LIFETIME
+        self.player.open_all()
+        
+        request_save()
+        delete_later(interaction.delete_original_response)
+
+        await run_parallel(
+            interaction.channel.send(
+                embed=discord.Embed(
+                    title=T("msg.reveal_all_public_title", self.lang, name=self.player.name), 
+                    description=T("msg.reveal_all_public_desc", self.lang), 
+                    color=EmbedColors.VOTING
+                ), 
+                delete_after=ANNOUNCEMENT_LIFETIME
+            ),
+            interaction.response.edit_message(content=None, embed=tech_embed(T("msg.reveal_success", self.lang), "success"), view=None),
         )
-        
-        await interaction.response.edit_message(content=None, embed=tech_embed(T("msg.reveal_success", self.lang), "success"), view=None)
-        
-        asyncio.create_task(save_active_games())
-        await asyncio.sleep(BRIEF_MSG_LIFETIME)
-        try: await interaction.delete_original_response()
-        except: pass
-
-        await game.update_board(interaction.client)
+        game.schedule_board_update(interaction.client)
 
 class GuideCategorySelect(discord.ui.Select):
     def __init__(self, lang):
         self.lang = lang
-        g_txt = T("guide", lang)
-        options = [
-            discord.SelectOption(label=g_txt.get("phobia_label", "Phobias") if isinstance(g_txt, dict) else "Phobias", value="phobia", emoji="😱"),
-            discord.SelectOption(label=g_txt.get("health_label", "Health") if isinstance(g_txt, dict) else "Health", value="health", emoji="🏥")
-        ]
-        placeholder = g_txt.get("select_category", "Select Category") if isinstance(g_txt, dict) else "Select Category"
-        super().__init__(placeholder=placeholder, options=options, custom_id="bunker:guide_cat")
+        cached = GUIDE_CATEGORIES.get(lang)
+        placeholder, options = cached if cached is not None else build_guide_categories(T("guide", lang))
+        super().__init__(placeholder=placeholder, options=list(options), custom_id="bunker:guide_cat")
 
     async def callback(self, interaction):
         data_dict = T("phobias" if self.values[0] == "phobia" else "health", self.lang)
@@ -220,10 +286,12 @@ class GuideItemSelect(discord.ui.Select):
     def __init__(self, data_source, category_name, lang):
         self.data_source = data_source
         self.lang = lang
-        options = []
-        for k in sorted(data_source.keys()):
-            options.append(discord.SelectOption(label=k))
-        if len(options) > 25: options = options[:25]
+        # Prebuilt at language load; only a language missing the section falls back to sorting here
+        cached = GUIDE_OPTIONS.get((lang, category_name))
+        if cached is not None:
+            options = list(cached)
+        else:
+            options = [discord.SelectOption(label=k) for k in sorted(data_source.keys())[:25]]
         super().__init__(placeholder=f"List: {category_name}", options=options, custom_id=f"bunker:guide_item:{category_name}")
 
     async def callback(self, interaction):
@@ -237,26 +305,32 @@ class GuideItemSelect(discord.ui.Select):
                 ephemeral=True
             )
 
+@lang_cache(maxsize=32)
+def _button_labels(lang: str, buttons: Tuple[Tuple[str, str], ...]) -> Tuple[str, ...]:
+    """Translated labels for a (custom_id prefix, label key) button table, once per language."""
+    return tuple(T(key, lang) for _, key in buttons)
+
+# Dashboard buttons in declaration order: (custom_id prefix, label key)
+DASH_BUTTONS = (
+    ("profile", "ui.profile_btn"),
+    ("reveal", "ui.reveal_btn"),
+    ("guide", "ui.guide_btn"),
+    ("vote", "ui.vote_start_btn"),
+)
+
 class Dashboard(discord.ui.View):
-    def __init__(self, lang, guild_id):
+    """Persistent in-game controls. Callbacks resolve the game from the interaction's guild,
+    so one instance per language serves every game (see dashboard_for)."""
+    def __init__(self, lang, guild_id: Optional[int] = None):
         super().__init__(timeout=None)
         self.lang = lang
-        self.guild_id = guild_id
-        
-        self.children[0].custom_id = f"bunker:profile:{guild_id}"
-        self.children[0].label = T("ui.profile_btn", lang)
-        
-        self.children[1].custom_id = f"bunker:reveal:{guild_id}"
-        self.children[1].label = T("ui.reveal_btn", lang)
-        
-        self.children[2].custom_id = f"bunker:guide:{guild_id}"
-        self.children[2].label = T("ui.guide_btn", lang)
         
-        self.children[3].custom_id = f"bunker:vote:{guild_id}"
-        self.children[3].label = T("ui.vote_start_btn", lang)
-
-    async def on_timeout(self):
-        pass
+        # Shared dashboards are scoped by language; a guild_id reproduces the per-guild
+        # custom_ids of dashboards posted before they were shared
+        scope = lang if guild_id is None else guild_id
+        for child, (name, _), label in zip(self.children, DASH_BUTTONS, _button_labels(lang, DASH_BUTTONS)):
+            child.custom_id = f"bunker:{name}:{scope}"
+            child.label = label
 
     @discord.ui.button(emoji="📂", style=discord.ButtonStyle.primary, row=0)
     async def profile(self, interaction, button):
@@ -282,6 +356,10 @@ class Dashboard(discord.ui.View):
         p = game.get_player(interaction.user.id)
         
         if p and p.alive:
+            if p.opened_mask == ALL_CARDS_MASK:
+                # Nothing left to reveal; skip building the menu
+                await safe_response(interaction, embed=tech_embed(T("msg.reveal_nothing", self.lang), "info"), ephemeral=True, delete_after=BRIEF_MSG_LIFETIME)
+                return
             await safe_response(interaction, T("ui.reveal_placeholder", self.lang), view=RevealView(p), ephemeral=True)
         else:
             await safe_response(interaction, embed=tech_embed("Not in game or dead.", "error"), ephemeral=True)
@@ -300,11 +378,12 @@ class Dashboard(discord.ui.View):
         await safe_response(interaction, content=None, embed=tech_embed(T("ui.guide_placeholder", self.lang), "info"), view=view, ephemeral=True)
 
     @discord.ui.button(emoji="🔴", style=discord.ButtonStyle.danger, row=1)
+    @guild_serialized
     async def vote(self, interaction, button):
         game = get_game_safe(interaction)
         if not game: return
         if interaction.user.id != game.host_id:
-            await safe_response(interaction, embed=tech_embed(T("msg.only_host", self.lang), "error"), ephemeral=True)
+            await safe_followup(interaction, embed=tech_embed(T("msg.only_host", self.lang), "error"), ephemeral=True)
             return
         
         game.phase = GamePhase.VOTING
@@ -312,22 +391,71 @@ class Dashboard(discord.ui.View):
         
         alive = game.alive_players()
         if len(alive) <= game.bunker_spots:
-            await safe_response(interaction, embed=tech_embed("Time to finish!", "info"), ephemeral=True)
+            await safe_followup(interaction, embed=tech_embed("Time to finish!", "info"), ephemeral=True)
             return
 
-        embed = discord.Embed(title=T("ui.vote_title", self.lang), description=T("ui.vote_desc", self.lang), color=EmbedColors.VOTING)
         mx = 2 if game.double_elim_next else 1
-        if game.double_elim_next: embed.set_footer(text=T("ui.vote_footer_double", self.lang))
-        
-        embed.add_field(name="Status", value="Waiting...")
-        await safe_response(interaction, embed=embed, view=VoteView(alive, mx, self.lang, game.guild_id), ephemeral=False)
-        asyncio.create_task(save_active_games())
+        view = VoteView(alive, mx, self.lang, game.guild_id)
+        view.client = interaction.client
+        view.message = await safe_followup(interaction, embed=view.status_embed, view=view, ephemeral=False)
+        game.vote_msg_id = view.message.id if view.message else None
+        request_save()
+
+def kick_stories_for(count: int, lang: str) -> List[str]:
+    """Distinct elimination stories for `count` players; repeats only once the pool is exhausted."""
+    pool = T("kick_descriptions", lang)
+    if count <= len(pool):
+        return random.sample(pool, count)
+    return random.sample(pool, len(pool)) + random.choices(pool, k=count - len(pool))
+
+# One shared Dashboard per language, created on first use
+_DASHBOARDS: Dict[str, Dashboard] = {}
+# Languages whose shared Dashboard is registered with the client (see register_dashboard)
+_REGISTERED_DASHBOARDS: Set[str] = set()
+
+def dashboard_for(lang: str) -> Dashboard:
+    view = _DASHBOARDS.get(lang)
+    if view is None:
+        view = _DASHBOARDS[lang] = Dashboard(lang)
+    return view
+
+def register_dashboard(client: discord.Client, lang: str) -> None:
+    """Registers the shared Dashboard for `lang` as a persistent view, once."""
+    if lang in _REGISTERED_DASHBOARDS: return
+    client.add_view(dashboard_for(lang))
+    _REGISTERED_DASHBOARDS.add(lang)
+
+# What gets posted for a new game: the same buttons, but stopped. discord.py
+# keeps every live view it sends in its view store under the message id until
+# the view stops (deleting the message does not evict it), so posting the
+# shared view would grow the store by one entry per game. Clicks are dispatched
+# to the registered dashboard_for(lang) by custom_id.
+_DASHBOARD_LAYOUTS: Dict[str, Dashboard] = {}
+
+def dashboard_layout(lang: str) -> Dashboard:
+    view = _DASHBOARD_LAYOUTS.get(lang)
+    if view is None:
+        view = _DASHBOARD_LAYOUTS[lang] = Dashboard(lang)
+        view.stop()
+    return view
 
 class VoteView(discord.ui.View):
     def __init__(self, candidates, max_select, lang, guild_id):
         super().__init__(timeout=VOTE_TIMEOUT)
         self.lang = lang
         self.guild_id = guild_id
+        # (voted, alive) currently rendered in the status field
+        self._last_shown: Optional[Tuple[int, int]] = None
+        # Whether the posted message shows the end button enabled
+        self._shown_ready = False
+        self._status_pending = False
+        # Set by Dashboard.vote once the vote message is posted; on_timeout resolves through them
+        self.message: Optional[discord.Message] = None
+        self.client: Optional[discord.Client] = None
+        # Status embed, built once and mutated in place on each update
+        self.status_embed = discord.Embed(title=T("ui.vote_title", lang), description=T("ui.vote_desc", lang), color=EmbedColors.VOTING)
+        if max_select > 1: self.status_embed.set_footer(text=T("ui.vote_footer_double", lang))
+        self.status_embed.add_field(name="Status", value="Waiting...")
         self.add_item(VoteSelect(candidates, max_select, guild_id))
         self.end_btn = discord.ui.Button(label=T("ui.end_vote_btn", lang), style=discord.ButtonStyle.secondary, disabled=True, custom_id=f"bunker:vote_end:{guild_id}")
         self.end_btn.callback = self.end_callback
@@ -335,152 +463,143 @@ class VoteView(discord.ui.View):
 
     async def on_timeout(self):
         # Auto-resolve logic on timeout
-        game = games.get(self.guild_id)
-        
-        if not game or game.phase != GamePhase.VOTING: return
-        
-        channel = None
-        client = None
-
-        if hasattr(self, 'message') and self.message:
+        if self.message is None: return
+        async with guild_lock(self.guild_id):
+            game = games.get(self.guild_id)
+            # Only the vote that is still open may resolve; an older round's view must not touch a later one
+            if not game or game.phase != GamePhase.VOTING or game.vote_msg_id != self.message.id: return
+            
             channel = self.message.channel
-            client = self.message.guild.me.client
             try:
                 for child in self.children: child.disabled = True
                 await self.message.edit(view=self)
-            except: pass
-        
-        if not channel: return
+            except discord.HTTPException: pass
 
-        eliminated, text, is_draw = game.resolve_votes()
+            timeout_embed = discord.Embed(title="⏰ " + T("ui.vote_title", self.lang), description="Voting timed out. Resolving...", color=EmbedColors.ERROR)
+            await channel.send(embed=timeout_embed, delete_after=ANNOUNCEMENT_LIFETIME)
+            await self.resolve_round(game, channel, self.client)
 
-        timeout_embed = discord.Embed(title="⏰ " + T("ui.vote_title", self.lang), description="Voting timed out. Resolving...", color=EmbedColors.ERROR)
-        await channel.send(embed=timeout_embed, delete_after=ANNOUNCEMENT_LIFETIME)
+    async def resolve_round(self, game, channel, client: Optional[discord.Client]) -> None:
+        """Resolves the votes and announces the outcome. Callers hold the guild lock."""
+        game.vote_msg_id = None
+        eliminated, text, is_draw = game.resolve_votes()
 
         if is_draw:
             await channel.send(embed=discord.Embed(title=T("msg.draw", self.lang), description=T("msg.draw_desc", self.lang), color=EmbedColors.VOTING), delete_after=ANNOUNCEMENT_LIFETIME)
-            asyncio.create_task(save_active_games())
+            request_save()
             return
 
-        res_desc = ""
-        kick_stories = T("kick_descriptions", self.lang)
-        for p in eliminated:
-            p.alive = False
-            await update_user_stats(p.user_id, "deaths", 1)
-            story = random.choice(kick_stories)
-            res_desc += f"💀 **{p.name}**\n*{story}*\n\n"
-
-        await channel.send(embed=discord.Embed(title=T("ui.results_title", self.lang), description=res_desc, color=EmbedColors.ELIMINATION).set_footer(text=text), delete_after=RESULT_MSG_LIFETIME)
-        
-        if client: await game.update_board(client)
-        asyncio.create_task(save_active_games())
+        parts = []
+        stat_updates = []
+        for p, story in zip(eliminated, kick_stories_for(len(eliminated), self.lang)):
+            game.eliminate(p)
+            stat_updates.append((p.user_id, "deaths", 1))
+            parts.append(f"💀 **{p.name}**\n*{story}*\n\n")
+        res_desc = "".join(parts)
+
+        game_over = game.alive_count() <= game.bunker_spots
+        if game_over:
+            # Stats for all participants are collected before end_game clears the roster
+            survivors = game.alive_players()
+            stat_updates += game.participant_stats()
+            stat_updates += [(p.user_id, "wins", 1) for p in survivors]
+
+        # One DB write for the whole round, overlapped with the Discord calls
+        await run_parallel(
+            channel.send(embed=discord.Embed(title=T("ui.results_title", self.lang), description=res_desc, color=EmbedColors.ELIMINATION).set_footer(text=text), delete_after=RESULT_MSG_LIFETIME),
+            update_user_stats_bulk(stat_updates),
+        )
+        if client: game.schedule_board_update(client)
+        request_save()
 
-        if len(game.alive_players()) <= game.bunker_spots:
+        if game_over:
             if client: await game.end_game(client)
-            survivors = ", ".join([p.name for p in game.alive_players()])
-            for p in game.alive_players():
-                await update_user_stats(p.user_id, "wins", 1)
-            
-            # AUDIT FIX: Stats for all participants at end of game
-            D = T("data", game.lang)
-            for p in game.players:
-                 try:
-                    age_val = int(p.cards.get('age', 25))
-                 except: age_val = 25
-                 sex_val = p.cards.get('sex')
-                 sex_idx = 0 if sex_val == D["sexes"][0] else 1
-                 await update_user_stats(p.user_id, "game_start", {"age": age_val, "sex_idx": sex_idx})
 
             story = game.calculate_ending()
-            await channel.send(embed=discord.Embed(title=T("ui.win_title", self.lang), description=f"**Survivors:** {survivors}\n\n{story}", color=EmbedColors.VICTORY))
-            
-            if client: await game.update_board(client)
+            await channel.send(embed=discord.Embed(title=T("ui.win_title", self.lang), description=f"**Survivors:** {', '.join(p.name for p in survivors)}\n\n{story}", color=EmbedColors.VICTORY))
         else:
             game.phase = GamePhase.REVEAL
             await channel.send(embed=discord.Embed(title=T("ui.game_continue", self.lang), description=T("ui.game_continue_desc", self.lang), color=EmbedColors.VOTING), delete_after=ANNOUNCEMENT_LIFETIME)
-            asyncio.create_task(save_active_games())
+            request_save()
+
+    def schedule_status_update(self, message) -> None:
+        """Coalesces counter refreshes: at most one edit per VOTE_STATUS_DEBOUNCE window."""
+        if self._status_pending: return
+        self._status_pending = True
+        spawn(self._debounced_status_update(message))
+
+    async def _debounced_status_update(self, message) -> None:
+        await asyncio.sleep(VOTE_STATUS_DEBOUNCE)
+        self._status_pending = False
+        game = games.get(self.guild_id)
+        # Ending the vote deletes the message
+        if not game or game.phase != GamePhase.VOTING: return
+        try: await self.update_status(message)
+        except discord.HTTPException as e: logger.warning(f"Guild {self.guild_id}: vote status edit failed: {e}")
 
     async def update_status(self, message):
         game = games.get(self.guild_id)
         if not game: return
         
         voted_count = len(game.votes)
-        alive_count = len(game.alive_players())
+        alive_count = game.alive_count()
+        # Changing an existing vote leaves the counter as it was; skip the edit round-trip
+        shown = (voted_count, alive_count)
+        if shown == self._last_shown: return
         
-        embed = message.embeds[0]
+        embed = self.status_embed
         embed.set_field_at(0, name="Status", value=f"Voted: {voted_count}/{alive_count}")
         
-        if voted_count >= alive_count:
-            self.end_btn.disabled = False
-            self.end_btn.style = discord.ButtonStyle.success
+        ready = voted_count >= alive_count
+        # The components only change when the end button flips; otherwise send just the embed.
+        # Rendered state is recorded only after Discord accepts the edit, so a failed edit is retried in full.
+        if ready != self._shown_ready:
+            self._set_end_ready(ready)
+            try:
+                await message.edit(embed=embed, view=self)
+            except discord.HTTPException:
+                self._set_end_ready(self._shown_ready)
+                raise
+            self._shown_ready = ready
         else:
-            self.end_btn.disabled = True
-            self.end_btn.style = discord.ButtonStyle.secondary
-        
-        await message.edit(embed=embed, view=self)
+            await message.edit(embed=embed)
+        self._last_shown = shown
+
+    def _set_end_ready(self, ready: bool) -> None:
+        self.end_btn.disabled = not ready
+        self.end_btn.style = discord.ButtonStyle.success if ready else discord.ButtonStyle.secondary
 
+    # Resolving a vote writes stats and sends several messages; ack before any of it
+    @guild_serialized
     async def end_callback(self, interaction):
         game = get_game_safe(interaction)
         if not game: return
         if interaction.user.id != game.host_id:
-            await safe_response(interaction, embed=tech_embed(T("msg.only_host", self.lang), "error"), ephemeral=True)
+            await safe_followup(interaction, embed=tech_embed(T("msg.only_host", self.lang), "error"), ephemeral=True)
             return
         
         if not check_bot_perms(interaction):
-             await safe_response(interaction, embed=tech_embed("Permissions missing.", "error"), ephemeral=True)
+             await safe_followup(interaction, embed=tech_embed("Permissions missing.", "error"), ephemeral=True)
              return
 
-        eliminated, text, is_draw = game.resolve_votes()
+        # A second click queued behind the first finds the round already resolved
+        if game.phase != GamePhase.VOTING: return
+        # Resolved by hand: drop the view from the store so its timeout cannot fire later
+        self.stop()
         
         try: await interaction.message.delete()
-        except: pass
+        except discord.HTTPException: pass
 
-        if is_draw:
-            await interaction.channel.send(embed=discord.Embed(title=T("msg.draw", self.lang), description=T("msg.draw_desc", self.lang), color=EmbedColors.VOTING), delete_after=ANNOUNCEMENT_LIFETIME)
-            asyncio.create_task(save_active_games())
-            return
-
-        res_desc = ""
-        kick_stories = T("kick_descriptions", self.lang)
-        for p in eliminated:
-            p.alive = False
-            await update_user_stats(p.user_id, "deaths", 1)
-            story = random.choice(kick_stories)
-            res_desc += f"💀 **{p.name}**\n*{story}*\n\n"
-
-        await interaction.channel.send(embed=discord.Embed(title=T("ui.results_title", self.lang), description=res_desc, color=EmbedColors.ELIMINATION).set_footer(text=text), delete_after=RESULT_MSG_LIFETIME)
-        
-        await game.update_board(interaction.client)
-        asyncio.create_task(save_active_games())
-
-        if len(game.alive_players()) <= game.bunker_spots:
-            await game.end_game(interaction.client)
-            survivors = ", ".join([p.name for p in game.alive_players()])
-            for p in game.alive_players():
-                await update_user_stats(p.user_id, "wins", 1)
-            
-            # Update stats for everyone at end of game
-            D = T("data", game.lang)
-            for p in game.players:
-                 try:
-                    age_val = int(p.cards.get('age', 25))
-                 except: age_val = 25
-                 sex_val = p.cards.get('sex')
-                 sex_idx = 0 if sex_val == D["sexes"][0] else 1
-                 await update_user_stats(p.user_id, "game_start", {"age": age_val, "sex_idx": sex_idx})
+        await self.resolve_round(game, interaction.channel, interaction.client)
 
-            story = game.calculate_ending()
-            await interaction.channel.send(embed=discord.Embed(title=T("ui.win_title", self.lang), description=f"**Survivors:** {survivors}\n\n{story}", color=EmbedColors.VICTORY))
-            
-            await game.update_board(interaction.client)
-        else:
-            game.phase = GamePhase.REVEAL
-            await interaction.channel.send(embed=discord.Embed(title=T("ui.game_continue", self.lang), description=T("ui.game_continue_desc", self.lang), color=EmbedColors.VOTING), delete_after=ANNOUNCEMENT_LIFETIME)
-            asyncio.create_task(save_active_games())
+@lang_cache(maxsize=256)
+def _vote_options(candidates):
+    """Shared SelectOptions for a (name, user_id) candidate tuple; custom_ids stay per-view."""
+    return tuple(discord.SelectOption(label=name, value=str(uid), emoji="👤") for name, uid in candidates)
 
 class VoteSelect(discord.ui.Select):
     def __init__(self, candidates, max_sel, guild_id):
-        options = [discord.SelectOption(label=p.name, value=str(p.user_id), emoji="👤") for p in candidates]
+        options = list(_vote_options(tuple((p.name, p.user_id) for p in candidates)))
         super().__init__(placeholder="Kick...", min_values=1, max_values=max_sel, options=options, custom_id=f"bunker:vote_sel:{guild_id}")
     
     async def callback(self, interaction):
@@ -500,8 +619,15 @@ class VoteSelect(discord.ui.Select):
             await safe_response(interaction, embed=tech_embed(str(e), "error"), ephemeral=True)
             return
         
+        self.view.schedule_status_update(interaction.message)
         await safe_response(interaction, embed=tech_embed(T("msg.vote_accepted", self.view.lang), "success"), ephemeral=True, delete_after=BRIEF_MSG_LIFETIME)
-        await self.view.update_status(interaction.message)
+
+# Lobby buttons in declaration order: (custom_id prefix, label key)
+JOIN_BUTTONS = (
+    ("join", "ui.join_btn"),
+    ("start", "ui.start_btn"),
+    ("cancel", "ui.cancel_btn"),
+)
 
 class JoinView(discord.ui.View):
     def __init__(self, lang, guild_id):
@@ -509,15 +635,10 @@ class JoinView(discord.ui.View):
         self.lang = lang
         self.guild_id = guild_id
         
-        self.children[0].label = T("ui.join_btn", lang)
-        self.children[0].custom_id = f"bunker:join:{guild_id}"
-        
-        self.children[1].label = T("ui.start_btn", lang)
-        self.children[1].custom_id = f"bunker:start:{guild_id}"
+        for child, (name, _), label in zip(self.children, JOIN_BUTTONS, _button_labels(lang, JOIN_BUTTONS)):
+            child.custom_id = f"bunker:{name}:{guild_id}"
+            child.label = label
         self.children[1].disabled = True
-        
-        self.children[2].label = T("ui.cancel_btn", lang)
-        self.children[2].custom_id = f"bunker:cancel:{guild_id}"
 
     async def on_timeout(self):
         # Persistent view doesn't timeout automatically
@@ -536,33 +657,46 @@ class JoinView(discord.ui.View):
                 self.children[1].disabled = False
                 self.children[1].style = discord.ButtonStyle.success
             
-            emb = discord.Embed(title=T("ui.lobby_title", self.lang), description=f"{T('ui.host_label', self.lang)} <@{game.host_id}>\n{T('ui.players_label', self.lang)} {len(game.players)}/{game.max_players}", color=EmbedColors.LOBBY)
-            await interaction.message.edit(embed=emb, view=self)
+            await interaction.message.edit(embed=lobby_embed(self.lang, game.host_id, len(game.players), game.max_players), view=self)
         else:
             await safe_response(interaction, embed=tech_embed(T("msg.no_seats", self.lang), "error"), ephemeral=True)
 
     @discord.ui.button(style=discord.ButtonStyle.danger, disabled=True)
+    @guild_serialized
     async def start(self, interaction, button):
         game = get_game_safe(interaction)
         if not game: return
         if interaction.user.id != game.host_id: return
         
         await game.start_game()
-        # Delete lobby message to clean up
-        await interaction.message.delete()
-        
-        await interaction.channel.send(embed=discord.Embed(title="☢️ INTRO", description=game.lore_text, color=EmbedColors.INTRO))
+        # Delete lobby message to clean up; the intro does not depend on it
+        await asyncio.gather(
+            interaction.message.delete(),
+            interaction.channel.send(embed=discord.Embed(title="☢️ INTRO", description=game.lore_text, color=EmbedColors.INTRO)),
+        )
         
-        game.board_message = await interaction.channel.send(embed=game.generate_board_embed())
-        game.board_msg_id = game.board_message.id
+        # Board and dashboard go out together after the intro.
+        # Posted as a stopped layout, so there is nothing to stop in end_game and no game.dashboard_view;
+        # the shared view that answers its buttons must be registered for this language
+        register_dashboard(interaction.client, self.lang)
+        # Either post may fail on its own; record whichever one landed
+        board, dash = await asyncio.gather(
+            interaction.channel.send(embed=game.generate_board_embed()),
+            interaction.channel.send(view=dashboard_layout(self.lang)),
+            return_exceptions=True,
+        )
         game.channel_id = interaction.channel.id
+        if isinstance(board, discord.Message):
+            game.board_message = board
+            game.board_msg_id = board.id
+        else:
+            logger.error(f"Guild {game.guild_id}: failed to post board: {board}")
+        if isinstance(dash, discord.Message):
+            game.dash_msg_id = dash.id
+        else:
+            logger.error(f"Guild {game.guild_id}: failed to post dashboard: {dash}")
         
-        game.dashboard_view = Dashboard(self.lang, game.guild_id)
-        msg = await interaction.channel.send(view=game.dashboard_view)
-        game.dash_msg_id = msg.id
-        
-        from .game import save_active_games
-        asyncio.create_task(save_active_games())
+        request_save()
 
     @discord.ui.button(style=discord.ButtonStyle.secondary)
     async def cancel(self, interaction, button):
@@ -577,7 +711,6 @@ class JoinView(discord.ui.View):
         confirm_btn = discord.ui.Button(label="Yes, Cancel Game", style=discord.ButtonStyle.danger)
 
         async def confirm_callback(conf_interaction: discord.Interaction):
-            from .game import delete_active_game
             await delete_active_game(interaction.guild.id)
             
             # Update ephemeral confirmation message
@@ -591,7 +724,7 @@ class JoinView(discord.ui.View):
             try:
                 if interaction.message:
                     await interaction.message.edit(content=None, embed=tech_embed(T("msg.game_cancelled", self.lang), "error"), view=None)
-            except:
+            except discord.HTTPException:
                 pass
 
         confirm_btn.callback = confirm_callback